@@ -3,6 +3,92 @@ import math
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba is optional — without it the kernels below run as plain Python
+    # and the public functions prefer vectorized NumPy paths instead
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+    prange = range
+
+
+@njit(cache=True)
+def _mape_kernel(a: np.ndarray, f: np.ndarray) -> float:
+    """MAPE over float64 arrays; returns -1.0 when no valid periods exist.
+
+    No fastmath here: NaN actuals must propagate into the result exactly
+    as they do in the vectorized fallback path.
+    """
+    total = 0.0
+    count = 0
+    for i in range(a.shape[0]):
+        if a[i] != 0.0:
+            total += abs(a[i] - f[i]) / abs(a[i])
+            count += 1
+    if count == 0:
+        return -1.0
+    return total / count * 100.0
+
+
+@njit(cache=True, fastmath=True)
+def _es_series_kernel(a: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponential-smoothing recurrence over a float64 array (F1 = D1)."""
+    n = a.shape[0]
+    f = np.empty(n)
+    f[0] = a[0]
+    for t in range(1, n):
+        f[t] = alpha * a[t - 1] + (1.0 - alpha) * f[t - 1]
+    return f
+
+
+def _es_series_closed_form(a: np.ndarray, alpha: float) -> np.ndarray:
+    """Closed-form exponential smoothing via a scaled cumulative sum.
+
+    Expands F[t] = beta^t * A[0] + alpha * sum(beta^(t-k) * A[k-1]) so the
+    whole series comes out of one cumsum and two element-wise multiplies
+    instead of a Python loop. The 1/beta^k scaling overflows once
+    beta^(n-1) underflows, so the wrapper only routes series here while
+    the weights stay representable.
+    """
+    n = a.size
+    beta = 1.0 - alpha
+    f = np.empty(n)
+    f[0] = a[0]
+    if n == 1:
+        return f
+    if beta == 0.0:
+        # alpha == 1: the forecast is just the previous actual
+        f[1:] = a[:-1]
+        return f
+    w = beta ** np.arange(n)
+    scaled = alpha * a[:-1] / w[1:]
+    f[1:] = w[1:] * (a[0] + np.cumsum(scaled))
+    return f
+
+
+@njit(cache=True, fastmath=True)
+def _variance_kernel(a: np.ndarray, ddof: int) -> float:
+    """Sample variance of a finite float64 array."""
+    n = a.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += a[i]
+    mean /= n
+    sse = 0.0
+    for i in range(n):
+        sse += (a[i] - mean) ** 2
+    return sse / (n - ddof)
+
+
 def moving_average(actuals: List[float], window: int) -> float:
     """Calculate moving average forecast for the next period."""
     if window <= 0:
@@ -19,78 +105,166 @@ def exponential_smoothing(actual_prev: float, forecast_prev: float, alpha: float
     return alpha * actual_prev + (1 - alpha) * forecast_prev
 
 
-def exponential_smoothing_series(actuals: List[float], alpha: float) -> List[float]:
+def exponential_smoothing_series(actuals: Union[List[float], np.ndarray], alpha: float) -> np.ndarray:
     """Generate forecast series using exponential smoothing (assumes F1 = D1)."""
-    if not actuals:
+    if len(actuals) == 0:
         raise ValueError("actuals cannot be empty")
     if not 0 <= alpha <= 1:
         raise ValueError("alpha must be between 0 and 1")
-    
-    forecasts = [actuals[0]]
-    for t in range(1, len(actuals)):
-        ft = alpha * actuals[t - 1] + (1 - alpha) * forecasts[t - 1]
-        forecasts.append(ft)
-    return forecasts
+
+    a = np.asarray(actuals, dtype=np.float64)
+    if _HAS_NUMBA:
+        return _es_series_kernel(a, alpha)
+
+    beta = 1.0 - alpha
+    if beta == 0.0 or a.size == 1 or (a.size - 1) * math.log(beta) > -700.0:
+        return _es_series_closed_form(a, alpha)
+    # beta^(n-1) would underflow — the recurrence loop is the only
+    # numerically safe evaluation at this length/alpha
+    return _es_series_kernel(a, alpha)
 
 
-def mape(actuals: List[float], forecasts: List[float]) -> float:
+@njit(cache=True, parallel=True)
+def _es_batch_kernel(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Column-wise exponential smoothing over a (T, N) float64 matrix.
+
+    Ragged series are NaN-padded; leading NaNs are skipped and forecasts
+    are emitted only at rows where the column has data, so a length-T
+    series yields exactly T forecasts, like exponential_smoothing_series.
+    """
+    n_rows, n_cols = x.shape
+    out = np.empty((n_rows, n_cols))
+    for j in prange(n_cols):
+        start = 0
+        while start < n_rows and not np.isfinite(x[start, j]):
+            out[start, j] = np.nan
+            start += 1
+        if start == n_rows:
+            continue
+        out[start, j] = x[start, j]
+        for t in range(start + 1, n_rows):
+            cur = x[t, j]
+            prev_a = x[t - 1, j]
+            prev_f = out[t - 1, j]
+            if np.isfinite(cur) and np.isfinite(prev_a) and np.isfinite(prev_f):
+                out[t, j] = alpha * prev_a + (1.0 - alpha) * prev_f
+            else:
+                out[t, j] = np.nan
+    return out
+
+
+def exponential_smoothing_batch(series_matrix: np.ndarray, alpha: float) -> np.ndarray:
+    """Run exponential smoothing on many series at once.
+
+    Takes a (T, N) matrix with one series per column (NaN-padded when
+    lengths differ) and returns the matching matrix of one-step-ahead
+    forecasts. Amortizes dispatch overhead across all series, so this is
+    the entry point to use when forecasting every product/wholesaler
+    combination rather than a single pair.
+    """
+    if not 0 <= alpha <= 1:
+        raise ValueError("alpha must be between 0 and 1")
+
+    x = np.asarray(series_matrix, dtype=np.float64)
+    if x.ndim != 2:
+        raise ValueError("series_matrix must be 2-dimensional (T, N)")
+    if x.shape[0] == 0:
+        raise ValueError("series_matrix cannot be empty")
+
+    return _es_batch_kernel(x, alpha)
+
+
+def mape(actuals: Union[List[float], np.ndarray], forecasts: Union[List[float], np.ndarray]) -> float:
     """Calculate Mean Absolute Percentage Error (MAPE) as a percentage."""
     if len(actuals) != len(forecasts):
         raise ValueError("actuals and forecasts must be the same length")
-    
-    ape_values = []
-    for a, f in zip(actuals, forecasts):
-        if a == 0:
-            continue
-        ape_values.append(abs(a - f) / abs(a))
-    
-    if not ape_values:
+
+    a = np.asarray(actuals, dtype=np.float64)
+    f = np.asarray(forecasts, dtype=np.float64)
+
+    if _HAS_NUMBA:
+        result = _mape_kernel(a, f)
+        if result < 0:
+            raise ValueError("no valid periods to compute MAPE")
+        return result
+
+    # Vectorized fallback: mask zero actuals, then one ufunc chain
+    mask = a != 0
+    if not mask.any():
         raise ValueError("no valid periods to compute MAPE")
-    
-    return sum(ape_values) / len(ape_values) * 100
+    return float(np.mean(np.abs((a[mask] - f[mask]) / a[mask])) * 100)
 
 
-def deseasonalize(actuals: List[float], seasonal_index: List[float]) -> List[float]:
+def deseasonalize(actuals: Union[List[float], np.ndarray], seasonal_index: Union[List[float], np.ndarray]) -> np.ndarray:
     """Remove seasonal component from actuals."""
     if len(actuals) != len(seasonal_index):
         raise ValueError("actuals and seasonal_index must be the same length")
-    return [a / s for a, s in zip(actuals, seasonal_index)]
+    return np.asarray(actuals, dtype=np.float64) / np.asarray(seasonal_index, dtype=np.float64)
 
 
-def reseasonalize(forecasts: List[float], seasonal_index: List[float]) -> List[float]:
+def reseasonalize(forecasts: Union[List[float], np.ndarray], seasonal_index: Union[List[float], np.ndarray]) -> np.ndarray:
     """Reapply seasonal component to forecasts."""
     if len(forecasts) != len(seasonal_index):
         raise ValueError("forecasts and seasonal_index must be the same length")
-    return [f * s for f, s in zip(forecasts, seasonal_index)]
+    return np.asarray(forecasts, dtype=np.float64) * np.asarray(seasonal_index, dtype=np.float64)
 
 
 def sample_variance(x: Iterable[float], ddof: int = 1) -> float:
     """Calculate sample variance (matches Excel VAR.S with ddof=1 by default)."""
-    vals = []
-    for v in x:
-        if v is None:
-            continue
+    if isinstance(x, np.ndarray) and np.issubdtype(x.dtype, np.number):
+        arr = x.astype(np.float64, copy=False)
+    else:
+        # Materialize once so a one-shot iterator is not half-consumed by
+        # a failed bulk conversion
+        items = [v for v in x if v is not None]
         try:
-            fv = float(v)
+            arr = np.asarray(items, dtype=np.float64)
         except (TypeError, ValueError):
-            continue
-        if math.isnan(fv) or math.isinf(fv):
-            continue
-        vals.append(fv)
-    
-    n = len(vals)
+            # Mixed junk — keep only the float-castable values
+            vals = []
+            for v in items:
+                try:
+                    vals.append(float(v))
+                except (TypeError, ValueError):
+                    continue
+            arr = np.asarray(vals, dtype=np.float64)
+    arr = arr[np.isfinite(arr)]
+
+    n = arr.shape[0]
     if n <= ddof:
         raise ValueError(f"Need at least {ddof + 1} valid observations; got {n}")
-    
-    mean = sum(vals) / n
-    sse = sum((v - mean) ** 2 for v in vals)
-    return sse / (n - ddof)
+
+    if _HAS_NUMBA:
+        return _variance_kernel(arr, ddof)
+    return float(arr.var(ddof=ddof))
 
 
 def bullwhip_ratio(shipment: Iterable[float], demand: Iterable[float], ddof: int = 1, epsilon: float = 0.0) -> float:
     """Calculate bullwhip ratio = Var(shipments) / Var(demand)."""
-    var_ship = sample_variance(shipment, ddof=ddof)
-    var_dem = sample_variance(demand, ddof=ddof)
+    # Materialize once so one-shot iterators survive the fast-path attempt
+    ship_src = shipment if isinstance(shipment, np.ndarray) else list(shipment)
+    dem_src = demand if isinstance(demand, np.ndarray) else list(demand)
+
+    try:
+        ship = np.asarray(ship_src, dtype=np.float64)
+        dem = np.asarray(dem_src, dtype=np.float64)
+    except (TypeError, ValueError):
+        ship = dem = None
+
+    if (
+        ship is not None
+        and ship.size == dem.size
+        and ship.size > ddof
+        and np.isfinite(ship).all()
+        and np.isfinite(dem).all()
+    ):
+        # Equal-length clean series: one stacked pass yields both variances
+        v = np.stack((ship, dem)).var(axis=1, ddof=ddof)
+        var_ship, var_dem = float(v[0]), float(v[1])
+    else:
+        # Ragged or dirty input — fall back to per-series cleaning
+        var_ship = sample_variance(ship_src, ddof=ddof)
+        var_dem = sample_variance(dem_src, ddof=ddof)
     
     denom = var_dem if var_dem > epsilon else epsilon
     if denom == 0.0:
@@ -99,19 +273,58 @@ def bullwhip_ratio(shipment: Iterable[float], demand: Iterable[float], ddof: int
     return var_ship / denom
 
 
+def measure_bullwhip_effect_arr(demand: np.ndarray, shipments: np.ndarray, ddof: int = 1) -> Dict:
+    """Variance-ratio core of measure_bullwhip_effect on pre-aggregated arrays.
+
+    Callers that already hold per-period totals (e.g. integer month buckets
+    out of a pivot) can use this directly and skip the DataFrame
+    filtering/resampling wrapper.
+    """
+    demand = np.asarray(demand, dtype=np.float64)
+    shipments = np.asarray(shipments, dtype=np.float64)
+
+    if demand.size != shipments.size:
+        raise ValueError("demand and shipments must be the same length")
+
+    if demand.size <= ddof:
+        # Too few periods for the requested ddof: variances are undefined.
+        # Report NaNs rather than raising, matching the pandas .var()
+        # behavior the original implementation relied on.
+        var_demand = float('nan')
+        var_ship = float('nan')
+    else:
+        var_demand = float(demand.var(ddof=ddof))
+        var_ship = float(shipments.var(ddof=ddof))
+
+    if var_demand == 0.0:
+        raise ValueError("Demand variance is zero; bullwhip ratio undefined.")
+
+    return {
+        'bullwhip_ratio': var_ship / var_demand,
+        'var_shipments': var_ship,
+        'var_demand': var_demand,
+        'n_periods': int(demand.size),
+    }
+
+
 def measure_bullwhip_effect(df: pd.DataFrame, date_col: str, demand_col: str, shipments_col: str, freq: str = "M", filters: Optional[Dict] = None) -> Dict:
     """Measure bullwhip effect by aggregating to periods and computing variance ratio."""
     if date_col not in df.columns or demand_col not in df.columns or shipments_col not in df.columns:
         raise KeyError("Required columns not found in DataFrame")
     
-    d = df.copy()
-    
+    cols = [date_col, demand_col, shipments_col]
+
     if filters:
-        for k, v in filters.items():
-            if k not in d.columns:
+        for k in filters:
+            if k not in df.columns:
                 raise KeyError(f"filter column '{k}' not in df.columns")
-            d = d.loc[d[k] == v]
-    
+        # One combined mask, one slice — no full-frame copy and no
+        # intermediate frame per filter
+        mask = np.logical_and.reduce([df[k].values == v for k, v in filters.items()])
+        d = df.loc[mask, cols]
+    else:
+        d = df[cols]
+
     d[date_col] = pd.to_datetime(d[date_col], errors="coerce")
     d = d.dropna(subset=[date_col])
     
@@ -119,27 +332,19 @@ def measure_bullwhip_effect(df: pd.DataFrame, date_col: str, demand_col: str, sh
     d[shipments_col] = pd.to_numeric(d[shipments_col], errors="coerce")
     d = d.dropna(subset=[demand_col, shipments_col])
     
+    # Resample straight off the sorted date column — no intermediate
+    # DatetimeIndex frame to build
+    d = d.sort_values(date_col)
     agg = (
-        d.set_index(date_col)[[demand_col, shipments_col]]
-        .resample(freq)
+        d.resample(freq, on=date_col)[[demand_col, shipments_col]]
         .sum(min_count=1)
         .dropna()
     )
     
     if agg.empty:
         raise ValueError("No data after filtering/cleaning/aggregation.")
-    
-    var_demand = agg[demand_col].var()
-    var_ship = agg[shipments_col].var()
-    
-    if var_demand == 0.0:
-        raise ValueError("Demand variance is zero; bullwhip ratio undefined.")
-    
-    ratio = var_ship / var_demand
-    
-    return {
-        'bullwhip_ratio': float(ratio),
-        'var_shipments': float(var_ship),
-        'var_demand': float(var_demand),
-        'n_periods': int(len(agg)),
-    }
+
+    return measure_bullwhip_effect_arr(
+        agg[demand_col].to_numpy(),
+        agg[shipments_col].to_numpy(),
+    )
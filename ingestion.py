@@ -1,23 +1,43 @@
+import functools
+import hashlib
 import pandas as pd
 import os
 from pathlib import Path
 from typing import Union, Optional
 
 
-def load_excel_file(file_path: str, sheet_name: Union[str, int] = 0, verbose: bool = False) -> Optional[pd.DataFrame]:
+@functools.lru_cache(maxsize=4)
+def _open_xlsx(file_path: str, mtime: float) -> pd.ExcelFile:
+    """Parse a workbook once per (path, mtime) — editing the file invalidates the key."""
+    try:
+        # Rust-backed parser, several times faster than openpyxl's
+        # pure-Python XML parsing
+        return pd.ExcelFile(file_path, engine='calamine')
+    except (ImportError, ValueError):
+        # python-calamine not installed (or pandas predates the engine)
+        return pd.ExcelFile(file_path)
+
+
+def load_excel_file(file_path: str, sheet_name: Union[str, int] = 0, verbose: bool = False,
+                    usecols: Optional[list] = None, dtype: Optional[dict] = None) -> Optional[pd.DataFrame]:
     """
     Load an Excel file into a pandas DataFrame.
-    
+
     Args:
         file_path (str): Path to the Excel file
         sheet_name (str or int): Sheet name or index to read. Defaults to 0 (first sheet)
         verbose (bool): Whether to print loading messages. Defaults to False
-    
+        usecols (list, optional): Columns to read; other columns are skipped at parse time
+        dtype (dict, optional): Column name -> dtype applied during parsing
+
     Returns:
         pd.DataFrame: DataFrame containing the Excel data
     """
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
+        # Reuse the parsed workbook so loading several sheets only pays
+        # the zip/XML parse once
+        xls = _open_xlsx(file_path, os.path.getmtime(file_path))
+        df = xls.parse(sheet_name=sheet_name, usecols=usecols, dtype=dtype)
         if verbose:
             print(f"Successfully loaded Excel file: {file_path}")
             print(f"Shape: {df.shape}")
@@ -41,28 +61,142 @@ def list_sheet_names(file_path):
         list: List of sheet names
     """
     try:
-        xls = pd.ExcelFile(file_path)
+        xls = _open_xlsx(file_path, os.path.getmtime(file_path))
         return xls.sheet_names
     except Exception as e:
         print(f"Error reading Excel file: {e}")
         return None
 
 
-def ingest_excel(file_name: str, sheet_name: Union[str, int] = 0, verbose: bool = False) -> Optional[pd.DataFrame]:
+class _LoadFailed(Exception):
+    """Internal: a sheet load returned None.
+
+    Raised instead of returning None from the cached loader, because
+    lru_cache memoizes return values but not exceptions — a failed load
+    must stay retryable on the next call.
+    """
+
+
+def _parquet_cache_path(file_path: str, sheet_name: Union[str, int],
+                        usecols: Optional[tuple] = None, dtype_items: Optional[tuple] = None) -> Path:
+    """Build the sidecar Parquet path for a (workbook, sheet, columns) combination."""
+    safe_sheet = str(sheet_name).replace(os.sep, "_")
+    if usecols is None and dtype_items is None:
+        return Path(f"{file_path}.{safe_sheet}.parquet")
+    # Column subsets / dtype overrides get their own sidecar so a cached
+    # full-sheet read is never confused with a narrowed one
+    digest = hashlib.md5(repr((usecols, dtype_items)).encode()).hexdigest()[:8]
+    return Path(f"{file_path}.{safe_sheet}.{digest}.parquet")
+
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink a freshly ingested frame's memory footprint in place.
+
+    Float columns are downcast to the narrowest float that holds their
+    values, and the low-cardinality product/wholesaler key columns become
+    category codes. Every later scan over these columns then moves
+    proportionally fewer bytes.
+    """
+    for c in df.select_dtypes('float').columns:
+        df[c] = pd.to_numeric(df[c], downcast='float')
+    # Text columns arrive as object dtype on older pandas and as string
+    # dtype on pandas 3.x — catch both
+    def _is_text(col):
+        return col.dtype == object or pd.api.types.is_string_dtype(col)
+
+    for c in ('PDCN', 'Wslr', 'Product', 'Wholesaler'):
+        if c in df.columns and _is_text(df[c]):
+            df[c] = df[c].astype('category')
+    # Known date columns become datetime64 right here, so downstream joins
+    # and groupbys key on int64 timestamps instead of per-row parsed objects
+    for c in ('Week Beginning',):
+        if c in df.columns and _is_text(df[c]):
+            df[c] = pd.to_datetime(df[c], errors='coerce')
+    return df
+
+
+@functools.lru_cache(maxsize=8)
+def _ingest_excel_cached(file_path: str, sheet_name: Union[str, int], verbose: bool,
+                         usecols: Optional[tuple] = None, dtype_items: Optional[tuple] = None) -> Optional[pd.DataFrame]:
+    """
+    Load a sheet, going through a Parquet sidecar cache when possible.
+
+    The first read of a sheet parses the Excel XML once and writes a
+    Parquet copy next to the workbook; later cold starts read the Parquet
+    instead. Repeated calls in the same process hit the lru_cache and skip
+    file I/O entirely.
+    """
+    cache_path = _parquet_cache_path(file_path, sheet_name, usecols, dtype_items)
+
+    # Workbook may have been deleted since the sidecar was written; treat
+    # that like any other load failure instead of raising out of the cache
+    try:
+        cache_fresh = cache_path.exists() and cache_path.stat().st_mtime >= os.path.getmtime(file_path)
+    except OSError:
+        cache_fresh = False
+
+    if cache_fresh:
+        try:
+            df = pd.read_parquet(cache_path)
+            if verbose:
+                print(f"Loaded cached Parquet: {cache_path}")
+            return df
+        except Exception as e:
+            if verbose:
+                print(f"Parquet cache read failed ({e}); falling back to Excel")
+
+    df = load_excel_file(
+        file_path,
+        sheet_name=sheet_name,
+        verbose=verbose,
+        usecols=list(usecols) if usecols is not None else None,
+        dtype=dict(dtype_items) if dtype_items is not None else None,
+    )
+
+    if df is None:
+        raise _LoadFailed(file_path)
+
+    df = _compact_dtypes(df)
+    try:
+        df.to_parquet(cache_path, compression='zstd')
+    except Exception as e:
+        # No Parquet engine (or unwritable directory) — just skip caching
+        if verbose:
+            print(f"Could not write Parquet cache: {e}")
+
+    return df
+
+
+def ingest_excel(file_name: str, sheet_name: Union[str, int] = 0, verbose: bool = False,
+                 usecols: Optional[list] = None, dtype: Optional[dict] = None) -> Optional[pd.DataFrame]:
     """
     Ingest an Excel file from the data directory.
-    
+
+    Results are cached in-process and as Parquet sidecars, so repeated
+    loads of the same sheet skip Excel parsing.
+
     Args:
         file_name (str): Name of the Excel file in the data directory
         sheet_name (str or int): Sheet name or index to read. Defaults to 0
         verbose (bool): Whether to print loading messages. Defaults to False
-    
+        usecols (list, optional): Columns to read; unlisted columns are
+            skipped at parse time
+        dtype (dict, optional): Column name -> dtype applied during parsing
+
     Returns:
         pd.DataFrame: DataFrame containing the Excel data
     """
     data_dir = Path(__file__).parent / "data"
     file_path = data_dir / file_name
-    return load_excel_file(str(file_path), sheet_name=sheet_name, verbose=verbose)
+    # Normalize to hashable forms so the lru_cache can key on them
+    usecols_t = tuple(usecols) if usecols is not None else None
+    dtype_t = tuple(sorted(dtype.items())) if dtype is not None else None
+    try:
+        df = _ingest_excel_cached(str(file_path), sheet_name, verbose, usecols_t, dtype_t)
+    except _LoadFailed:
+        return None
+    # Copy so callers can mutate their frame without corrupting the cache
+    return df.copy()
 
 
 def get_schema(df):
@@ -75,11 +209,13 @@ def get_schema(df):
     Returns:
         pd.DataFrame: Schema information
     """
+    # One null-count scan; non-null counts are its complement
+    null_counts = df.isnull().sum()
     schema = pd.DataFrame({
         'Column': df.columns,
         'Data Type': df.dtypes.values,
-        'Non-Null Count': df.count().values,
-        'Null Count': df.isnull().sum().values
+        'Non-Null Count': (len(df) - null_counts).values,
+        'Null Count': null_counts.values
     })
     return schema
 